@@ -19,6 +19,12 @@ from .socket import (
     SERVER_CLOSED_CONNECTION_ERROR,
 )
 
+# hiredis frees its read buffer whenever it has been drained and has more
+# than maxbuf (16KB by default) spare room, and the buffer then has to be
+# allocated again on the next read. Let it keep a buffer large enough for
+# a couple of full socket reads instead.
+HIREDIS_READER_MAXBUF_FACTOR = 2
+
 
 class _HiredisReaderArgs(TypedDict, total=False):
     protocolError: Callable[[str], Exception]
@@ -56,6 +62,7 @@ class _HiredisParser(BaseParser):
         if connection.encoder.decode_responses:
             kwargs["encoding"] = connection.encoder.encoding
         self._reader = hiredis.Reader(**kwargs)
+        self._reader.setmaxbuf(HIREDIS_READER_MAXBUF_FACTOR * self.socket_read_size)
         self._next_response = False
 
     def on_disconnect(self):
@@ -162,6 +169,7 @@ class _AsyncHiredisParser(AsyncBaseParser):
             kwargs["errors"] = connection.encoder.encoding_errors
 
         self._reader = hiredis.Reader(**kwargs)
+        self._reader.setmaxbuf(HIREDIS_READER_MAXBUF_FACTOR * self._read_size)
         self._connected = True
 
     def on_disconnect(self):
@@ -22,14 +22,37 @@ class _RESP2Parser(_RESPBase):
             return result
 
     def _read_response(self, disable_decoding=False):
-        raw = self._buffer.readline()
+        buffer = self._buffer
+        raw = buffer.readline()
         if not raw:
             raise ConnectionError(SERVER_CLOSED_CONNECTION_ERROR)
 
         byte, response = raw[:1], raw[1:]
 
+        # the branches below are ordered by how often each reply type is seen
+        # on the wire: bulk strings and arrays make up the bulk of replies.
+        # bulk response
+        if byte == b"$":
+            if response == b"-1":
+                return None
+            response = buffer.read(int(response))
+        # multi-bulk response
+        elif byte == b"*":
+            if response == b"-1":
+                return None
+            # the elements are decoded by the recursive calls
+            return [
+                self._read_response(disable_decoding=disable_decoding)
+                for i in range(int(response))
+            ]
+        # int value
+        elif byte == b":":
+            return int(response)
+        # single value
+        elif byte == b"+":
+            pass
         # server returned an error
-        if byte == b"-":
+        elif byte == b"-":
             response = response.decode("utf-8", errors="replace")
             error = self.parse_error(response)
             # if the error is a ConnectionError, raise immediately so the user
@@ -41,25 +64,6 @@ class _RESP2Parser(_RESPBase):
             # and/or the pipeline's execute() will raise this error if
             # necessary, so just return the exception instance here.
             return error
-        # single value
-        elif byte == b"+":
-            pass
-        # int value
-        elif byte == b":":
-            return int(response)
-        # bulk response
-        elif byte == b"$" and response == b"-1":
-            return None
-        elif byte == b"$":
-            response = self._buffer.read(int(response))
-        # multi-bulk response
-        elif byte == b"*" and response == b"-1":
-            return None
-        elif byte == b"*":
-            response = [
-                self._read_response(disable_decoding=disable_decoding)
-                for i in range(int(response))
-            ]
         else:
             raise InvalidResponse(f"Protocol Error: {raw!r}")
 
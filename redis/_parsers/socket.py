@@ -1,7 +1,5 @@
 import errno
-import io
 import socket
-from io import SEEK_END
 from typing import Optional, Union
 
 from ..exceptions import ConnectionError, TimeoutError
@@ -25,6 +23,9 @@ SENTINEL = object()
 
 SYM_CRLF = b"\r\n"
 
+# compact a partially read SocketBuffer once this many bytes were consumed
+SOCKET_BUFFER_COMPACT_SIZE = 32768
+
 
 class SocketBuffer:
     def __init__(
@@ -33,16 +34,21 @@ class SocketBuffer:
         self._sock = socket
         self.socket_read_size = socket_read_size
         self.socket_timeout = socket_timeout
-        self._buffer = io.BytesIO()
+        # data read from the socket is appended to a single bytearray and
+        # consumed by moving a read cursor, so that finding the end of a line
+        # is a single bytearray.find() call
+        self._buffer = bytearray()
+        self._pos = 0
+        # scratch space filled by recv_into(), allocated once so that reads
+        # don't create a new bytes object per recv() call
+        self._recv_buffer = bytearray(socket_read_size)
+        self._recv_view = memoryview(self._recv_buffer)
 
     def unread_bytes(self) -> int:
         """
         Remaining unread length of buffer
         """
-        pos = self._buffer.tell()
-        end = self._buffer.seek(0, SEEK_END)
-        self._buffer.seek(pos)
-        return end - pos
+        return len(self._buffer) - self._pos
 
     def _read_from_socket(
         self,
@@ -51,23 +57,20 @@ class SocketBuffer:
         raise_on_timeout: Optional[bool] = True,
     ) -> bool:
         sock = self._sock
-        socket_read_size = self.socket_read_size
+        recv_view = self._recv_view
         marker = 0
         custom_timeout = timeout is not SENTINEL
 
         buf = self._buffer
-        current_pos = buf.tell()
-        buf.seek(0, SEEK_END)
         if custom_timeout:
             sock.settimeout(timeout)
         try:
             while True:
-                data = self._sock.recv(socket_read_size)
-                # an empty string indicates the server shutdown the socket
-                if isinstance(data, bytes) and len(data) == 0:
+                data_length = sock.recv_into(recv_view)
+                # reading zero bytes indicates the server shutdown the socket
+                if data_length == 0:
                     raise ConnectionError(SERVER_CLOSED_CONNECTION_ERROR)
-                buf.write(data)
-                data_length = len(data)
+                buf.extend(recv_view[:data_length])
                 marker += data_length
 
                 if length is not None and length > marker:
@@ -87,7 +90,6 @@ class SocketBuffer:
                 return False
             raise ConnectionError(f"Error while reading from socket: {ex.args}")
         finally:
-            buf.seek(current_pos)
             if custom_timeout:
                 sock.settimeout(self.socket_timeout)
 
@@ -97,66 +99,59 @@ class SocketBuffer:
         )
 
     def read(self, length: int) -> bytes:
-        length = length + 2  # make sure to read the \r\n terminator
-        # BufferIO will return less than requested if buffer is short
-        data = self._buffer.read(length)
-        missing = length - len(data)
-        if missing:
+        buf = self._buffer
+        # make sure to read the \r\n terminator
+        end = self._pos + length + 2
+        missing = end - len(buf)
+        if missing > 0:
             # fill up the buffer and read the remainder
             self._read_from_socket(missing)
-            data += self._buffer.read(missing)
-        return data[:-2]
+        data = bytes(buf[self._pos : end - 2])
+        self._pos = end
+        return data
 
     def readline(self) -> bytes:
         buf = self._buffer
-        data = buf.readline()
-        while not data.endswith(SYM_CRLF):
-            # there's more data in the socket that we need
+        pos = self._pos
+        end = buf.find(SYM_CRLF, pos)
+        while end == -1:
+            # there's more data in the socket that we need. resume the
+            # search one byte back in case the \r\n is split across reads
+            start = max(len(buf) - 1, pos)
             self._read_from_socket()
-            data += buf.readline()
+            end = buf.find(SYM_CRLF, start)
 
-        return data[:-2]
+        self._pos = end + 2
+        return bytes(buf[pos:end])
 
     def get_pos(self) -> int:
         """
         Get current read position
         """
-        return self._buffer.tell()
+        return self._pos
 
     def rewind(self, pos: int) -> None:
         """
         Rewind the buffer to a specific position, to re-start reading
         """
-        self._buffer.seek(pos)
+        self._pos = pos
 
     def purge(self) -> None:
         """
         After a successful read, purge the read part of buffer
         """
-        unread = self.unread_bytes()
-
-        # Only if we have read all of the buffer do we truncate, to
-        # reduce the amount of memory thrashing.  This heuristic
-        # can be changed or removed later.
-        if unread > 0:
-            return
-
-        if unread > 0:
-            # move unread data to the front
-            view = self._buffer.getbuffer()
-            view[:unread] = view[-unread:]
-        self._buffer.truncate(unread)
-        self._buffer.seek(0)
+        # Drop the buffer once everything in it has been read, or compact
+        # it once the read part grows large, to reduce the amount of memory
+        # thrashing. This heuristic can be changed or removed later.
+        if not self.unread_bytes():
+            self._buffer.clear()
+            self._pos = 0
+        elif self._pos > SOCKET_BUFFER_COMPACT_SIZE:
+            del self._buffer[: self._pos]
+            self._pos = 0
 
     def close(self) -> None:
-        try:
-            self._buffer.close()
-        except Exception:
-            # issue #633 suggests the purge/close somehow raised a
-            # BadFileDescriptor error. Perhaps the client ran out of
-            # memory or something else? It's probably OK to ignore
-            # any error being raised from purge/close since we're
-            # removing the reference to the instance below.
-            pass
         self._buffer = None
+        self._recv_view = None
+        self._recv_buffer = None
         self._sock = None
@@ -410,27 +410,32 @@ class AbstractConnection:
             # ) != self.protocol:
             #     raise ConnectionError("Invalid RESP version")
 
+        # the remaining setup commands don't depend on each other's replies,
+        # so pack them together, send them in a single write and then read
+        # the replies in order
+        commands = []
         # if a client_name is given, set it
         if self.client_name:
-            await self.send_command("CLIENT", "SETNAME", self.client_name)
-            if str_if_bytes(await self.read_response()) != "OK":
-                raise ConnectionError("Error setting client name")
-
-        # set the library name and version, pipeline for lower startup latency
+            commands.append(("CLIENT", "SETNAME", self.client_name))
+        # set the library name and version
         if self.lib_name:
-            await self.send_command("CLIENT", "SETINFO", "LIB-NAME", self.lib_name)
+            commands.append(("CLIENT", "SETINFO", "LIB-NAME", self.lib_name))
         if self.lib_version:
-            await self.send_command("CLIENT", "SETINFO", "LIB-VER", self.lib_version)
-        # if a database is specified, switch to it. Also pipeline this
+            commands.append(("CLIENT", "SETINFO", "LIB-VER", self.lib_version))
+        # if a database is specified, switch to it
         if self.db:
-            await self.send_command("SELECT", self.db)
+            commands.append(("SELECT", self.db))
         # if client caching is enabled, start tracking
         if self.client_cache:
-            await self.send_command("CLIENT", "TRACKING", "ON")
-            await self.read_response()
-            self._parser.set_invalidation_push_handler(self._cache_invalidation_process)
+            commands.append(("CLIENT", "TRACKING", "ON"))
+        if not commands:
+            return
+        await self.send_packed_command(self.pack_commands(commands))
+
+        if self.client_name:
+            if str_if_bytes(await self.read_response()) != "OK":
+                raise ConnectionError("Error setting client name")
 
-        # read responses from pipeline
         for _ in (sent for sent in (self.lib_name, self.lib_version) if sent):
             try:
                 await self.read_response()
@@ -441,6 +446,10 @@ class AbstractConnection:
             if str_if_bytes(await self.read_response()) != "OK":
                 raise ConnectionError("Invalid Database")
 
+        if self.client_cache:
+            await self.read_response()
+            self._parser.set_invalidation_push_handler(self._cache_invalidation_process)
+
     async def disconnect(self, nowait: bool = False) -> None:
         """Disconnects from the Redis server"""
         try:
@@ -621,36 +630,31 @@ class AbstractConnection:
         elif b" " in args[0]:
             args = tuple(args[0].split()) + args[1:]
 
-        buff = SYM_EMPTY.join((SYM_STAR, str(len(args)).encode(), SYM_CRLF))
+        # collect the pieces of the current chunk in a list and join them
+        # once, rather than re-joining the whole chunk for every argument
+        pieces = [SYM_STAR, str(len(args)).encode(), SYM_CRLF]
+        pieces_length = len(pieces[1]) + 3
 
         buffer_cutoff = self._buffer_cutoff
         for arg in map(self.encoder.encode, args):
             # to avoid large string mallocs, chunk the command into the
             # output list if we're sending large values or memoryviews
             arg_length = len(arg)
+            arg_length_bytes = str(arg_length).encode()
             if (
-                len(buff) > buffer_cutoff
+                pieces_length > buffer_cutoff
                 or arg_length > buffer_cutoff
                 or isinstance(arg, memoryview)
             ):
-                buff = SYM_EMPTY.join(
-                    (buff, SYM_DOLLAR, str(arg_length).encode(), SYM_CRLF)
-                )
-                output.append(buff)
+                pieces += (SYM_DOLLAR, arg_length_bytes, SYM_CRLF)
+                output.append(SYM_EMPTY.join(pieces))
                 output.append(arg)
-                buff = SYM_CRLF
+                pieces = [SYM_CRLF]
+                pieces_length = 2
             else:
-                buff = SYM_EMPTY.join(
-                    (
-                        buff,
-                        SYM_DOLLAR,
-                        str(arg_length).encode(),
-                        SYM_CRLF,
-                        arg,
-                        SYM_CRLF,
-                    )
-                )
-        output.append(buff)
+                pieces += (SYM_DOLLAR, arg_length_bytes, SYM_CRLF, arg, SYM_CRLF)
+                pieces_length += len(arg_length_bytes) + arg_length + 5
+        output.append(SYM_EMPTY.join(pieces))
         return output
 
     def pack_commands(self, commands: Iterable[Iterable[EncodableT]]) -> List[bytes]:
@@ -6,6 +6,7 @@ import sys
 import threading
 import weakref
 from abc import abstractmethod
+from functools import lru_cache
 from itertools import chain
 from queue import Empty, Full, LifoQueue
 from time import time
@@ -53,6 +54,67 @@ SYM_EMPTY = b""
 
 DEFAULT_RESP_VERSION = 2
 
+# pre-encoded RESP bulk strings for the integer arguments and command names
+# that show up in most commands (db indexes, TTLs, counters, ...)
+_INT_RESP_CACHE = {i: f"${len(str(i))}\r\n{i}\r\n".encode() for i in range(-128, 1024)}
+_CMD_RESP_CACHE = {
+    cmd: b"$%d\r\n%s\r\n" % (len(cmd), cmd)
+    for cmd in (
+        b"AUTH",
+        b"CLIENT",
+        b"DEL",
+        b"EXEC",
+        b"EXPIRE",
+        b"GET",
+        b"HELLO",
+        b"HGET",
+        b"HSET",
+        b"INCR",
+        b"MULTI",
+        b"PING",
+        b"SELECT",
+        b"SET",
+    )
+}
+# only bytes this short are looked up, so large values are never hashed
+_CMD_RESP_CACHE_MAX_LEN = max(map(len, _CMD_RESP_CACHE))
+# bulk string length prefixes ("$<length>\r\n") for the common short lengths
+_LEN_PREFIXES = [f"${i}\r\n".encode() for i in range(1024)]
+
+# the number of packed command names to keep, e.g. "GET" or "CLIENT SETNAME"
+_COMMAND_NAME_CACHE_SIZE = 1024
+# commands whose name is followed by a subcommand, e.g. "CLIENT SETNAME".
+# any other word in a command name is an argument and is never cached
+_SUBCOMMAND_CONTAINERS = frozenset(
+    (
+        "ACL",
+        "CLIENT",
+        "CLUSTER",
+        "COMMAND",
+        "CONFIG",
+        "FUNCTION",
+        "LATENCY",
+        "MEMORY",
+        "MODULE",
+        "OBJECT",
+        "PUBSUB",
+        "SCRIPT",
+        "SLOWLOG",
+        "XGROUP",
+        "XINFO",
+    )
+)
+
+# the number of packed float arguments to keep, since they tend to repeat
+# (timeouts, scores, ...)
+_FLOAT_RESP_CACHE_SIZE = 256
+
+# the maximum number of buffers that can be passed to a single sendmsg() call
+try:
+    IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16)
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 16
+
 SENTINEL = object()
 
 DefaultParser: Type[Union[_RESP2Parser, _RESP3Parser, _HiredisParser]]
@@ -62,6 +124,94 @@ else:
     DefaultParser = _RESP2Parser
 
 
+def _encode_command_name(name):
+    """
+    Split a command name into its words and pack them as RESP bulk strings.
+    Returns a tuple of the number of words and the packed bytes.
+    """
+    words = name.encode().split()
+    return (
+        len(words),
+        SYM_EMPTY.join(
+            _CMD_RESP_CACHE.get(word) or b"$%d\r\n%s\r\n" % (len(word), word)
+            for word in words
+        ),
+    )
+
+
+_encode_cached_command_name = lru_cache(maxsize=_COMMAND_NAME_CACHE_SIZE)(
+    _encode_command_name
+)
+
+
+def _pack_command_name(name):
+    """
+    Pack a command name, keeping the most recently used ones cached.
+    """
+    # arguments can be passed as part of the name, e.g. "AUTH password", so
+    # only cache plain command names and subcommands
+    words = name.split()
+    if len(words) == 1 or (
+        len(words) == 2 and words[0].upper() in _SUBCOMMAND_CONTAINERS
+    ):
+        return _encode_cached_command_name(name)
+    return _encode_command_name(name)
+
+
+def _can_sendmsg(sock):
+    """
+    Whether the buffers of a packed command can be written to the socket with
+    sendmsg(). SSL sockets define sendmsg() but refuse to use it.
+    """
+    return (
+        isinstance(sock, socket.socket)
+        and not isinstance(sock, ssl.SSLSocket)
+        and hasattr(sock, "sendmsg")
+    )
+
+
+def _sendmsg_all(sock, buffers):
+    """
+    Write all buffers to the socket using scatter/gather I/O, rather than
+    joining them into a single bytes object or writing them one by one.
+    """
+    buffers = list(buffers)
+    while buffers:
+        sent = sock.sendmsg(buffers[:IOV_MAX])
+        # drop the buffers that were written completely and trim the one that
+        # was only written partially
+        written = 0
+        while written < len(buffers) and sent >= len(buffers[written]):
+            sent -= len(buffers[written])
+            written += 1
+        del buffers[:written]
+        if sent:
+            buffers[0] = memoryview(buffers[0])[sent:]
+
+
+def _encode_float(value):
+    """
+    Pack a float argument as a RESP bulk string, using its repr() like
+    Encoder.encode() does.
+    """
+    encoded = repr(value).encode()
+    return b"$%d\r\n%s\r\n" % (len(encoded), encoded)
+
+
+_encode_cached_float = lru_cache(maxsize=_FLOAT_RESP_CACHE_SIZE)(_encode_float)
+
+
+def _pack_float(value):
+    """
+    Pack a float argument, keeping the most recently used ones cached.
+    """
+    # 0.0 and -0.0 compare equal but are packed differently, and nan
+    # never compares equal to itself, so neither is cached
+    if value and value == value:
+        return _encode_cached_float(value)
+    return _encode_float(value)
+
+
 class HiredisRespSerializer:
     def pack(self, *args: List):
         """Pack a series of arguments into the Redis protocol"""
@@ -92,42 +242,67 @@ class PythonRespSerializer:
         # the command name, e.g., 'CONFIG GET'. The Redis server expects these
         # arguments to be sent separately, so split the first argument
         # manually. These arguments should be bytestrings so that they are
-        # not encoded.
+        # not encoded. str command names are packed once and then reused.
+        name_length = 0
+        packed_name = SYM_EMPTY
         if isinstance(args[0], str):
-            args = tuple(args[0].encode().split()) + args[1:]
+            name_length, packed_name = _pack_command_name(args[0])
+            args = args[1:]
         elif b" " in args[0]:
             args = tuple(args[0].split()) + args[1:]
 
-        buff = SYM_EMPTY.join((SYM_STAR, str(len(args)).encode(), SYM_CRLF))
+        # collect the pieces of the current chunk in a list and join them
+        # once, rather than re-joining the whole chunk for every argument
+        pieces = [
+            SYM_STAR,
+            str(name_length + len(args)).encode(),
+            SYM_CRLF,
+            packed_name,
+        ]
+        pieces_length = len(pieces[1]) + len(packed_name) + 3
 
         buffer_cutoff = self._buffer_cutoff
-        for arg in map(self.encode, args):
+        encode = self.encode
+        for arg in args:
+            # small integers, floats and common command names are looked up
+            # in tables of pre-encoded bulk strings. check the exact type,
+            # since bools and floats compare equal to ints
+            arg_type = type(arg)
+            if arg_type is int:
+                fragment = _INT_RESP_CACHE.get(arg)
+            elif arg_type is float:
+                fragment = _pack_float(arg)
+            elif arg_type is bytes and len(arg) <= _CMD_RESP_CACHE_MAX_LEN:
+                fragment = _CMD_RESP_CACHE.get(arg)
+            else:
+                fragment = None
+            if fragment is not None:
+                pieces.append(fragment)
+                pieces_length += len(fragment)
+                continue
+
+            arg = encode(arg)
             # to avoid large string mallocs, chunk the command into the
             # output list if we're sending large values or memoryviews
             arg_length = len(arg)
+            if arg_length < 1024:
+                length_prefix = _LEN_PREFIXES[arg_length]
+            else:
+                length_prefix = b"$%d\r\n" % arg_length
             if (
-                len(buff) > buffer_cutoff
+                pieces_length > buffer_cutoff
                 or arg_length > buffer_cutoff
                 or isinstance(arg, memoryview)
             ):
-                buff = SYM_EMPTY.join(
-                    (buff, SYM_DOLLAR, str(arg_length).encode(), SYM_CRLF)
-                )
-                output.append(buff)
+                pieces.append(length_prefix)
+                output.append(SYM_EMPTY.join(pieces))
                 output.append(arg)
-                buff = SYM_CRLF
+                pieces = [SYM_CRLF]
+                pieces_length = 2
             else:
-                buff = SYM_EMPTY.join(
-                    (
-                        buff,
-                        SYM_DOLLAR,
-                        str(arg_length).encode(),
-                        SYM_CRLF,
-                        arg,
-                        SYM_CRLF,
-                    )
-                )
-        output.append(buff)
+                pieces += (length_prefix, arg, SYM_CRLF)
+                pieces_length += len(length_prefix) + arg_length + 2
+        output.append(SYM_EMPTY.join(pieces))
         return output
 
 
@@ -300,9 +475,7 @@ class AbstractConnection:
         if self._sock:
             return
         try:
-            sock = self.retry.call_with_retry(
-                lambda: self._connect(), lambda error: self.disconnect(error)
-            )
+            sock = self.retry.call_with_retry(self._connect, self.disconnect)
         except socket.timeout:
             raise TimeoutError("Timeout connecting to server")
         except OSError as e:
@@ -405,36 +578,49 @@ class AbstractConnection:
             ):
                 raise ConnectionError("Invalid RESP version")
 
+        # the remaining setup commands don't depend on each other's replies,
+        # so pack them together, send them in a single write and then read
+        # the replies in order
+        commands = []
         # if a client_name is given, set it
         if self.client_name:
-            self.send_command("CLIENT", "SETNAME", self.client_name)
+            commands.append(("CLIENT", "SETNAME", self.client_name))
+        # set the library name and version
+        if self.lib_name:
+            commands.append(("CLIENT", "SETINFO", "LIB-NAME", self.lib_name))
+        if self.lib_version:
+            commands.append(("CLIENT", "SETINFO", "LIB-VER", self.lib_version))
+        # if a database is specified, switch to it
+        if self.db:
+            commands.append(("SELECT", self.db))
+        # if client caching is enabled, start tracking
+        if self.client_cache:
+            commands.append(("CLIENT", "TRACKING", "ON"))
+        if not commands:
+            return
+        self.send_packed_command(self.pack_commands(commands))
+
+        if self.client_name:
             if str_if_bytes(self.read_response()) != "OK":
                 raise ConnectionError("Error setting client name")
 
         try:
-            # set the library name and version
             if self.lib_name:
-                self.send_command("CLIENT", "SETINFO", "LIB-NAME", self.lib_name)
                 self.read_response()
         except ResponseError:
             pass
 
         try:
             if self.lib_version:
-                self.send_command("CLIENT", "SETINFO", "LIB-VER", self.lib_version)
                 self.read_response()
         except ResponseError:
             pass
 
-        # if a database is specified, switch to it
         if self.db:
-            self.send_command("SELECT", self.db)
             if str_if_bytes(self.read_response()) != "OK":
                 raise ConnectionError("Invalid Database")
 
-        # if client caching is enabled, start tracking
         if self.client_cache:
-            self.send_command("CLIENT", "TRACKING", "ON")
             self.read_response()
             self._parser.set_invalidation_push_handler(self._cache_invalidation_process)
 
@@ -486,8 +672,12 @@ class AbstractConnection:
         try:
             if isinstance(command, str):
                 command = [command]
-            for item in command:
-                self._sock.sendall(item)
+            sock = self._sock
+            if len(command) > 1 and _can_sendmsg(sock):
+                _sendmsg_all(sock, command)
+            else:
+                for item in command:
+                    sock.sendall(item)
         except socket.timeout:
             self.disconnect()
             raise TimeoutError("Timeout writing to socket")
@@ -971,6 +1161,22 @@ URL_QUERY_ARGUMENT_PARSERS = {
 
 
 def parse_url(url):
+    # parsing is cached per url, except for urls carrying credentials, which
+    # shouldn't be kept around in a module level cache. callers are free to
+    # modify the kwargs they get back, so hand out a copy, including of any
+    # list values
+    unquoted = unquote(url)
+    if "@" in url or "username" in unquoted or "password" in unquoted:
+        kwargs = _parse_url(url)
+    else:
+        kwargs = _parse_cached_url(url)
+    return {
+        name: list(value) if isinstance(value, list) else value
+        for name, value in kwargs.items()
+    }
+
+
+def _parse_url(url):
     if not (
         url.startswith("redis://")
         or url.startswith("rediss://")
@@ -1027,6 +1233,9 @@ def parse_url(url):
     return kwargs
 
 
+_parse_cached_url = lru_cache(maxsize=128)(_parse_url)
+
+
 class ConnectionPool:
     """
     Create a connection pool. ``If max_connections`` is set, then this
@@ -105,6 +105,12 @@ def pytest_addoption(parser):
     parser.addoption(
         "--uvloop", action=BooleanOptionalAction, help="Run tests with uvloop"
     )
+    parser.addoption(
+        "--fast-parser",
+        action="store_true",
+        default=False,
+        help="Only run parser tests against the hiredis parser",
+    )
 
     parser.addoption(
         "--sentinels",
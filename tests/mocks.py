@@ -4,17 +4,19 @@
 class MockSocket:
     """
     A class simulating an readable socket, optionally raising a
-    special exception every other read.
+    special exception every other read. Data is returned in chunks
+    of at most `chunk_size` bytes.
     """
 
     class TestError(BaseException):
         pass
 
-    def __init__(self, data, interrupt_every=0):
+    def __init__(self, data, interrupt_every=0, chunk_size=8):
         self.data = data
         self.counter = 0
         self.pos = 0
         self.interrupt_every = interrupt_every
+        self.chunk_size = chunk_size
 
     def tick(self):
         self.counter += 1
@@ -25,7 +27,7 @@ class MockSocket:
 
     def recv(self, bufsize):
         self.tick()
-        bufsize = min(5, bufsize)  # truncate the read size
+        bufsize = min(self.chunk_size, bufsize)  # truncate the read size
         result = self.data[self.pos : self.pos + bufsize]
         self.pos += len(result)
         return result
@@ -34,7 +36,7 @@ class MockSocket:
         self.tick()
         if nbytes == 0:
             nbytes = len(buffer)
-        nbytes = min(5, nbytes)  # truncate the read size
+        nbytes = min(self.chunk_size, nbytes)  # truncate the read size
         result = self.data[self.pos : self.pos + nbytes]
         self.pos += len(result)
         buffer[: len(result)] = result
@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import pytest
 import redis
+from redis._cache import _LocalCache
 from redis._parsers import (
     _AsyncHiredisParser,
     _AsyncRESP2Parser,
@@ -15,7 +16,12 @@ from redis.asyncio import ConnectionPool, Redis
 from redis.asyncio.connection import Connection, UnixDomainSocketConnection, parse_url
 from redis.asyncio.retry import Retry
 from redis.backoff import NoBackoff
-from redis.exceptions import ConnectionError, InvalidResponse, TimeoutError
+from redis.exceptions import (
+    ConnectionError,
+    InvalidResponse,
+    ResponseError,
+    TimeoutError,
+)
 from redis.utils import HIREDIS_AVAILABLE
 from tests.conftest import skip_if_server_version_lt
 
@@ -172,6 +178,61 @@ async def test_connect_timeout_error_without_retry():
     assert str(e.value) == "Timeout connecting to server"
 
 
+@pytest.mark.parametrize("client_name", [None, "myname"])
+@pytest.mark.parametrize("lib_name", [None, "redis-py"])
+@pytest.mark.parametrize("lib_version", [None, "1.0"])
+@pytest.mark.parametrize("db", [0, 1])
+@pytest.mark.parametrize("client_cache", [None, _LocalCache()])
+async def test_on_connect_sends_setup_commands_together(
+    client_name, lib_name, lib_version, db, client_cache
+):
+    """The connection setup commands are written at once and their replies are
+    read in the order the commands were sent"""
+    conn = Connection(
+        client_name=client_name,
+        lib_name=lib_name,
+        lib_version=lib_version,
+        db=db,
+        client_cache=client_cache,
+        protocol=3 if client_cache else 2,
+        parser_class=_AsyncRESP3Parser if client_cache else _AsyncRESP2Parser,
+    )
+    commands = []
+    replies = []
+    if client_cache:
+        # the HELLO reply, read before the setup commands are sent
+        replies.append({b"proto": 3})
+    if client_name:
+        commands.append(("CLIENT", "SETNAME", client_name))
+        replies.append(b"OK")
+    # older servers reject CLIENT SETINFO, which is ignored
+    if lib_name:
+        commands.append(("CLIENT", "SETINFO", "LIB-NAME", lib_name))
+        replies.append(ResponseError("unknown subcommand 'SETINFO'"))
+    if lib_version:
+        commands.append(("CLIENT", "SETINFO", "LIB-VER", lib_version))
+        replies.append(ResponseError("unknown subcommand 'SETINFO'"))
+    if db:
+        commands.append(("SELECT", db))
+        replies.append(b"OK")
+    if client_cache:
+        commands.append(("CLIENT", "TRACKING", "ON"))
+        replies.append(b"OK")
+    with patch.object(conn._parser, "on_connect"), patch.object(
+        Connection, "send_command"
+    ), patch.object(
+        Connection, "send_packed_command"
+    ) as send_packed_command, patch.object(
+        Connection, "read_response", side_effect=iter(replies)
+    ) as read_response:
+        await conn.on_connect()
+    if commands:
+        send_packed_command.assert_awaited_once_with(conn.pack_commands(commands))
+    else:
+        send_packed_command.assert_not_called()
+    assert read_response.await_count == len(replies)
+
+
 @pytest.mark.onlynoncluster
 async def test_connection_parse_response_resume(r: redis.Redis):
     """
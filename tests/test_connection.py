@@ -7,11 +7,15 @@ import pytest
 import redis
 from redis import ConnectionPool, Redis
 from redis._parsers import _HiredisParser, _RESP2Parser, _RESP3Parser
+from redis._parsers.socket import SOCKET_BUFFER_COMPACT_SIZE, SocketBuffer
 from redis.backoff import NoBackoff
+from redis.commands import RedisModuleCommands
 from redis.connection import (
     Connection,
+    PythonRespSerializer,
     SSLConnection,
     UnixDomainSocketConnection,
+    _sendmsg_all,
     parse_url,
 )
 from redis.exceptions import ConnectionError, InvalidResponse, TimeoutError
@@ -44,8 +48,6 @@ def test_loading_external_modules(r):
     assert isinstance(getattr(r, "myfuncname"), types.FunctionType)
 
     # and call it
-    from redis.commands import RedisModuleCommands
-
     j = RedisModuleCommands.json
     r.load_external_module("sometestfuncname", j)
 
@@ -55,38 +57,102 @@ def test_loading_external_modules(r):
     # assert mod.get('fookey') == d
 
 
+class _FakeSock:
+    """A socket stand-in recording shutdown() and close() calls"""
+
+    __slots__ = ("shutdown_called", "close_called", "shutdown_exc", "close_exc")
+
+    def __init__(self, shutdown_exc=None, close_exc=None):
+        self.shutdown_called = 0
+        self.close_called = 0
+        self.shutdown_exc = shutdown_exc
+        self.close_exc = close_exc
+
+    def shutdown(self, how):
+        self.shutdown_called += 1
+        if self.shutdown_exc is not None:
+            raise self.shutdown_exc
+
+    def close(self):
+        self.close_called += 1
+        if self.close_exc is not None:
+            raise self.close_exc
+
+
 class TestConnection:
     def test_disconnect(self):
         conn = Connection()
-        mock_sock = mock.Mock()
+        mock_sock = _FakeSock()
         conn._sock = mock_sock
         conn.disconnect()
-        mock_sock.shutdown.assert_called_once()
-        mock_sock.close.assert_called_once()
+        assert mock_sock.shutdown_called == 1
+        assert mock_sock.close_called == 1
         assert conn._sock is None
 
     def test_disconnect__shutdown_OSError(self):
         """An OSError on socket shutdown will still close the socket."""
         conn = Connection()
-        mock_sock = mock.Mock()
+        mock_sock = _FakeSock(shutdown_exc=OSError)
         conn._sock = mock_sock
-        conn._sock.shutdown.side_effect = OSError
         conn.disconnect()
-        mock_sock.shutdown.assert_called_once()
-        mock_sock.close.assert_called_once()
+        assert mock_sock.shutdown_called == 1
+        assert mock_sock.close_called == 1
         assert conn._sock is None
 
     def test_disconnect__close_OSError(self):
         """An OSError on socket close will still clear out the socket."""
         conn = Connection()
-        mock_sock = mock.Mock()
+        mock_sock = _FakeSock(close_exc=OSError)
         conn._sock = mock_sock
-        conn._sock.close.side_effect = OSError
         conn.disconnect()
-        mock_sock.shutdown.assert_called_once()
-        mock_sock.close.assert_called_once()
+        assert mock_sock.shutdown_called == 1
+        assert mock_sock.close_called == 1
         assert conn._sock is None
 
+    @pytest.mark.parametrize("client_name", [None, "myname"])
+    @pytest.mark.parametrize("lib_name", [None, "redis-py"])
+    @pytest.mark.parametrize("lib_version", [None, "1.0"])
+    @pytest.mark.parametrize("db", [0, 1])
+    def test_on_connect_sends_setup_commands_together(
+        self, client_name, lib_name, lib_version, db
+    ):
+        """The connection setup commands are written to the socket at once"""
+        conn = Connection(
+            client_name=client_name, lib_name=lib_name, lib_version=lib_version, db=db
+        )
+        commands = []
+        if client_name:
+            commands.append(("CLIENT", "SETNAME", client_name))
+        if lib_name:
+            commands.append(("CLIENT", "SETINFO", "LIB-NAME", lib_name))
+        if lib_version:
+            commands.append(("CLIENT", "SETINFO", "LIB-VER", lib_version))
+        if db:
+            commands.append(("SELECT", db))
+        # one reply per setup command, consumed in order
+        replies = iter((b"OK",) * len(commands))
+        with patch.object(conn._parser, "on_connect"), patch.object(
+            Connection, "send_packed_command"
+        ) as send_packed_command, patch.object(
+            Connection, "read_response", side_effect=replies
+        ) as read_response:
+            conn.on_connect()
+        if commands:
+            send_packed_command.assert_called_once_with(conn.pack_commands(commands))
+        else:
+            send_packed_command.assert_not_called()
+        assert read_response.call_count == len(commands)
+
+    def test_on_connect_invalid_db(self):
+        """A failed SELECT is reported after the other setup replies"""
+        conn = Connection(db=1)
+        replies = iter((b"OK", b"OK", b"ERR"))
+        with patch.object(conn._parser, "on_connect"), patch.object(
+            Connection, "send_packed_command"
+        ), patch.object(Connection, "read_response", side_effect=replies):
+            with pytest.raises(ConnectionError, match="Invalid Database"):
+                conn.on_connect()
+
     def clear(self, conn):
         conn.retry_on_error.clear()
 
@@ -138,14 +204,20 @@ class TestConnection:
     [_RESP2Parser, _RESP3Parser, _HiredisParser],
     ids=["RESP2Parser", "RESP3Parser", "HiredisParser"],
 )
-def test_connection_parse_response_resume(r: redis.Redis, parser_class):
+@pytest.mark.parametrize("chunk_size", [5, 8])
+def test_connection_parse_response_resume(
+    request, r: redis.Redis, parser_class, chunk_size
+):
     """
     This test verifies that the Connection parser,
     be that PythonParser or HiredisParser,
     can be interrupted at IO time and then resume parsing.
+    5 byte chunks split a \\r\\n terminator across two reads.
     """
     if parser_class is _HiredisParser and not HIREDIS_AVAILABLE:
         pytest.skip("Hiredis not available)")
+    if parser_class is not _HiredisParser and request.config.getoption("--fast-parser"):
+        pytest.skip("PythonParser skipped with --fast-parser")
     args = dict(r.connection_pool.connection_kwargs)
     args["parser_class"] = parser_class
     conn = Connection(**args)
@@ -154,7 +226,7 @@ def test_connection_parse_response_resume(r: redis.Redis, parser_class):
         b"*3\r\n$7\r\nmessage\r\n$8\r\nchannel1\r\n"
         b"$25\r\nhi\r\nthere\r\n+how\r\nare\r\nyou\r\n"
     )
-    mock_socket = MockSocket(message, interrupt_every=2)
+    mock_socket = MockSocket(message, interrupt_every=2, chunk_size=chunk_size)
 
     if isinstance(conn._parser, _RESP2Parser) or isinstance(conn._parser, _RESP3Parser):
         conn._parser._buffer._sock = mock_socket
@@ -173,6 +245,62 @@ def test_connection_parse_response_resume(r: redis.Redis, parser_class):
     assert i > 0
 
 
+def test_socket_buffer_readline_split_crlf():
+    """
+    This test verifies that SocketBuffer finds a \\r\\n terminator
+    which is split across two reads from the socket.
+    """
+    buffer = SocketBuffer(MockSocket(b"+OK\r\n$3\r\nfoo\r\n", chunk_size=4), 65536, 1)
+    assert buffer.readline() == b"+OK"
+    assert buffer.readline() == b"$3"
+    assert buffer.read(3) == b"foo"
+    assert buffer.unread_bytes() == 0
+
+
+def test_socket_buffer_rewind():
+    """
+    This test verifies that SocketBuffer can be rewound after a read
+    was interrupted and then read the same data again.
+    """
+    sock = MockSocket(b"$11\r\nhello world\r\n", interrupt_every=2, chunk_size=3)
+    buffer = SocketBuffer(sock, 65536, 1)
+    pos = buffer.get_pos()
+    interrupts = 0
+    while True:
+        try:
+            header = buffer.readline()
+            data = buffer.read(11)
+            break
+        except MockSocket.TestError:
+            interrupts += 1
+            buffer.rewind(pos)
+    assert (header, data) == (b"$11", b"hello world")
+    assert interrupts > 1
+    assert buffer.unread_bytes() == 0
+
+
+def test_socket_buffer_purge_compacts():
+    """
+    This test verifies that SocketBuffer keeps a small partially read
+    buffer as is and compacts it once the read part grows large.
+    """
+    size = SOCKET_BUFFER_COMPACT_SIZE
+    data = b"+OK\r\n$%d\r\n%s\r\n+PONG\r\n" % (size, b"x" * size)
+    buffer = SocketBuffer(MockSocket(data, chunk_size=len(data)), 65536, 1)
+    assert buffer.readline() == b"+OK"
+    buffer.purge()
+    assert buffer.get_pos() == 5
+    assert buffer.readline() == b"$%d" % size
+    assert buffer.read(size) == b"x" * size
+    buffer.purge()
+    assert buffer.get_pos() == 0
+    assert buffer.unread_bytes() == 7
+    assert buffer.readline() == b"+PONG"
+    buffer.purge()
+    assert buffer.get_pos() == 0
+    assert buffer.unread_bytes() == 0
+
+
 @pytest.mark.onlynoncluster
 @pytest.mark.parametrize(
     "Class",
@@ -205,10 +333,121 @@ def test_pack_command(Class):
         b"\r\nkey_f\r\n$13\r\n3.14159265359\r\n"
     )
 
-    actual = Class().pack_command(*cmd)[0]
+    actual = b"".join(Class().pack_command(*cmd))
     assert actual == expected, f"actual = {actual}, expected = {expected}"
 
 
+def test_sendmsg_all_partial_writes():
+    """
+    This test verifies that buffers written with sendmsg() are resumed
+    correctly when the socket only accepts part of the data.
+    """
+
+    class PartialSocket(socket.socket):
+        written = b""
+
+        def sendmsg(self, buffers):
+            # accept at most 3 bytes per call
+            data = b"".join(bytes(buffer) for buffer in buffers)[:3]
+            self.written += data
+            return len(data)
+
+    buffers = [b"*2\r\n$3\r\nSET\r\n$5\r\n", memoryview(b"value"), b"\r\n"]
+    with PartialSocket() as sock:
+        _sendmsg_all(sock, buffers)
+        assert sock.written == b"".join(bytes(buffer) for buffer in buffers)
+
+
+@pytest.mark.onlynoncluster
+def test_pack_command_numeric_args():
+    """
+    This test verifies that ints and floats which compare equal
+    are still packed according to their type.
+    """
+    conn = Connection()
+    packer = PythonRespSerializer(conn._buffer_cutoff, conn.encoder.encode)
+    expected_int = b"*3\r\n$3\r\nSET\r\n$1\r\na\r\n$1\r\n1\r\n"
+    expected_float = b"*3\r\n$3\r\nSET\r\n$1\r\na\r\n$3\r\n1.0\r\n"
+    assert b"".join(packer.pack("SET", "a", 1)) == expected_int
+    assert b"".join(packer.pack("SET", "a", 1.0)) == expected_float
+    # 0.0 and -0.0 compare equal as well
+    assert b"".join(packer.pack("SET", "a", 0.0)).endswith(b"$3\r\n0.0\r\n")
+    assert b"".join(packer.pack("SET", "a", -0.0)).endswith(b"$4\r\n-0.0\r\n")
+
+
+@pytest.mark.onlynoncluster
+def test_pack_command_float_cache_keeps_recent():
+    """
+    This test verifies that floats are still cached after many
+    distinct floats were packed.
+    """
+    conn = Connection()
+    packer = PythonRespSerializer(conn._buffer_cutoff, conn.encoder.encode)
+    for i in range(redis.connection._FLOAT_RESP_CACHE_SIZE * 2):
+        packer.pack("ZADD", "z", i + 0.5, "m")
+    hits = redis.connection._encode_cached_float.cache_info().hits
+    assert b"".join(packer.pack("SET", "a", 0.25)).endswith(b"$4\r\n0.25\r\n")
+    assert b"".join(packer.pack("SET", "a", 0.25)).endswith(b"$4\r\n0.25\r\n")
+    assert redis.connection._encode_cached_float.cache_info().hits == hits + 1
+
+
+@pytest.mark.onlynoncluster
+def test_pack_command_name_cache():
+    """
+    This test verifies that only command names without inline arguments
+    are cached, and that they are still cached after many other names.
+    """
+    conn = Connection()
+    packer = PythonRespSerializer(conn._buffer_cutoff, conn.encoder.encode)
+    cached = redis.connection._encode_cached_command_name
+    with mock.patch.object(
+        redis.connection, "_encode_cached_command_name", wraps=cached
+    ) as mock_cached:
+        for i in range(redis.connection._COMMAND_NAME_CACHE_SIZE * 2):
+            packer.pack(f"SET key{i} v")
+        assert b"".join(packer.pack("AUTH hunter2")) == (
+            b"*2\r\n$4\r\nAUTH\r\n$7\r\nhunter2\r\n"
+        )
+        packer.pack("ZADD", "z", 1, "m")
+        packer.pack("CLIENT SETNAME", "name")
+    assert [call.args[0] for call in mock_cached.call_args_list] == [
+        "ZADD",
+        "CLIENT SETNAME",
+    ]
+    hits = cached.cache_info().hits
+    packer.pack("ZADD", "z", 1, "m")
+    assert cached.cache_info().hits == hits + 1
+
+
+@pytest.mark.onlynoncluster
+def test_pack_command_large_bytes_not_looked_up(monkeypatch):
+    """
+    This test verifies that large bytes values are not looked up in
+    the table of pre-encoded command names, which would hash them in full.
+    """
+
+    class RecordingDict(dict):
+        def get(self, key, default=None):
+            looked_up.append(key)
+            return super().get(key, default)
+
+    looked_up = []
+    monkeypatch.setattr(
+        redis.connection,
+        "_CMD_RESP_CACHE",
+        RecordingDict(redis.connection._CMD_RESP_CACHE),
+    )
+    conn = Connection()
+    packer = PythonRespSerializer(conn._buffer_cutoff, conn.encoder.encode)
+    value = b"x" * 100000
+    output = packer.pack(b"SET", b"k", value)
+    assert (
+        b"".join(output) == b"*3\r\n$3\r\nSET\r\n$1\r\nk\r\n$100000\r\n%s\r\n" % value
+    )
+    assert value not in looked_up
+    assert b"SET" in looked_up
+
+
 @pytest.mark.onlynoncluster
 def test_create_single_connection_client_from_url():
     client = redis.Redis.from_url(
@@ -217,17 +456,26 @@ def test_create_single_connection_client_from_url():
     assert client.connection is not None
 
 
+# the connection arguments are the same for every test in this module, so
+# only parse the url once
+@pytest.fixture(scope="module")
+def redis_url(request):
+    return request.config.getoption("--redis-url")
+
+
+@pytest.fixture(scope="module")
+def connect_args(redis_url):
+    return parse_url(redis_url)
+
+
 @pytest.mark.parametrize("from_url", (True, False), ids=("from_url", "from_args"))
-def test_pool_auto_close(request, from_url):
+def test_pool_auto_close(redis_url, connect_args, from_url):
     """Verify that basic Redis instances have auto_close_connection_pool set to True"""
 
-    url: str = request.config.getoption("--redis-url")
-    url_args = parse_url(url)
-
     def get_redis_connection():
         if from_url:
-            return Redis.from_url(url)
-        return Redis(**url_args)
+            return Redis.from_url(redis_url)
+        return Redis(**connect_args)
 
     r1 = get_redis_connection()
     assert r1.auto_close_connection_pool is True
@@ -235,21 +483,18 @@ def test_pool_auto_close(request, from_url):
 
 
 @pytest.mark.parametrize("from_url", (True, False), ids=("from_url", "from_args"))
-def test_redis_connection_pool(request, from_url):
+def test_redis_connection_pool(redis_url, connect_args, from_url):
     """Verify that basic Redis instances using `connection_pool`
     have auto_close_connection_pool set to False"""
 
-    url: str = request.config.getoption("--redis-url")
-    url_args = parse_url(url)
-
     pool = None
 
     def get_redis_connection():
         nonlocal pool
         if from_url:
-            pool = ConnectionPool.from_url(url)
+            pool = ConnectionPool.from_url(redis_url)
         else:
-            pool = ConnectionPool(**url_args)
+            pool = ConnectionPool(**connect_args)
         return Redis(connection_pool=pool)
 
     called = 0
@@ -267,21 +512,18 @@ def test_redis_connection_pool(request, from_url):
 
 
 @pytest.mark.parametrize("from_url", (True, False), ids=("from_url", "from_args"))
-def test_redis_from_pool(request, from_url):
+def test_redis_from_pool(redis_url, connect_args, from_url):
     """Verify that basic Redis instances created using `from_pool()`
     have auto_close_connection_pool set to True"""
 
-    url: str = request.config.getoption("--redis-url")
-    url_args = parse_url(url)
-
     pool = None
 
     def get_redis_connection():
         nonlocal pool
         if from_url:
-            pool = ConnectionPool.from_url(url)
+            pool = ConnectionPool.from_url(redis_url)
         else:
-            pool = ConnectionPool(**url_args)
+            pool = ConnectionPool(**connect_args)
         return Redis.from_pool(pool)
 
     called = 0